@@ -8,85 +8,45 @@ Render: Will auto-detect and run this file
 import asyncio
 import json
 import os
+import random
+import sqlite3
 import sys
-from datetime import datetime
-from typing import Dict, Optional
-from threading import Thread
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
 import logging
+import logging.handlers
+import queue
 
-# ============= WEB SERVER FOR RENDER =============
+# ============= IMPORTS =============
+# Import the real modules directly - a failure here is the dependency check,
+# so nothing is loaded twice at startup
 try:
-    from flask import Flask
-    
-    app = Flask(__name__)
-    
-    @app.route('/')
-    def home():
-        return """
-        <h1>Solana LP Burn Monitor Bot ✅</h1>
-        <p>Status: Running</p>
-        <p>Monitor: Raydium LP Burns</p>
-        <p>Notifications: Telegram</p>
-        """
-    
-    @app.route('/health')
-    def health():
-        return "OK", 200
-    
-    def run_server():
-        port = int(os.environ.get('PORT', 10000))
-        app.run(host='0.0.0.0', port=port, debug=False)
-    
-    def start_web_server():
-        server_thread = Thread(target=run_server, daemon=True)
-        server_thread.start()
-        
-except ImportError:
-    print("Flask not installed - web server disabled")
-    def start_web_server():
-        pass
-
-# ============= DEPENDENCY CHECK =============
-required_packages = {
-    'solana': 'solana',
-    'aiohttp': 'aiohttp',
-    'telegram': 'python-telegram-bot',
-    'solders': 'solders',
-    'flask': 'flask'
-}
-
-missing_packages = []
-for import_name, package_name in required_packages.items():
-    try:
-        __import__(import_name)
-    except ImportError:
-        missing_packages.append(package_name)
-
-if missing_packages:
+    import aiohttp
+    import orjson
+    from aiohttp import web
+    from telegram import Bot
+    from telegram.error import TelegramError
+except ImportError as e:
+    package_names = {'telegram': 'python-telegram-bot'}
+    missing = package_names.get(e.name, e.name)
     print("=" * 50)
     print("MISSING REQUIRED PACKAGES!")
     print("=" * 50)
-    print(f"Please install: {', '.join(missing_packages)}")
+    print(f"Please install: {missing}")
     print("\nRun this command:")
-    print(f"pip install {' '.join(missing_packages)}")
+    print("pip install aiohttp python-telegram-bot orjson")
     print("\nOr create requirements.txt with:")
-    print("solana==0.30.2")
     print("aiohttp==3.9.1")
     print("python-telegram-bot==20.7")
-    print("solders==0.18.1")
-    print("flask==3.0.0")
+    print("orjson==3.9.10")
     print("=" * 50)
     sys.exit(1)
 
-# ============= IMPORTS =============
-import aiohttp
-from solana.rpc.async_api import AsyncClient
-from solana.rpc.commitment import Confirmed
-from solders.pubkey import Pubkey
-from solders.signature import Signature
-from telegram import Bot
-from telegram.error import TelegramError
-
 # ============= CONFIGURATION =============
 # Environment variables (set these in Render)
 TELEGRAM_BOT_TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN")
@@ -99,33 +59,181 @@ RPC_URLS = [
     "https://mainnet.solana.rpcpool.com",  # RPC Pool
     "https://solana-mainnet.rpc.extrnode.com",  # ExtrNode
 ]
-CHECK_INTERVAL = int(os.environ.get("CHECK_INTERVAL", "30"))  # Increased to 30s
+# Comma-separated SOLANA_RPC_URLS replaces the built-in pool entirely
+# (a value with no actual URLs in it, e.g. ",", keeps the built-in pool)
+_env_rpc_urls = [url.strip() for url in os.environ.get("SOLANA_RPC_URLS", "").split(",") if url.strip()]
+if _env_rpc_urls:
+    RPC_URLS = _env_rpc_urls
+# WebSocket endpoint for logsSubscribe (defaults to the primary RPC host)
+SOLANA_WS_URL = os.environ.get(
+    "SOLANA_WS_URL",
+    RPC_URLS[0].replace("https://", "wss://", 1).replace("http://", "ws://", 1)
+)
+BATCH_SIZE = int(os.environ.get("BATCH_SIZE", "20"))  # Max signatures per getTransaction batch
+MAX_CONCURRENT_REQUESTS = int(os.environ.get("MAX_CONCURRENT_REQUESTS", "16"))
+BACKFILL_MAX_PAGES = 5  # getSignaturesForAddress pages (1000 each) per reconnect
+CHECK_WORKERS = int(os.environ.get("CHECK_WORKERS", "4"))  # Parallel transaction checkers
+BREAKER_THRESHOLD = 5  # Consecutive failures before an endpoint's breaker opens
+BREAKER_COOLDOWN = 30  # Seconds an open breaker waits before a half-open probe
+RATE_LIMIT_COOLDOWNS = (30, 120, 300, 600)  # Escalating benches for repeated 429s
+RPC_RATE_LIMIT = float(os.environ.get("RPC_RATE_LIMIT", "0"))  # RPC POSTs per second, 0 = unlimited
+MAX_RETRIES = 3  # Retries per request after a 429
+MAX_RETRY_AFTER = 60  # Upper bound on a server-supplied Retry-After sleep
+# Per-call deadlines (seconds) so a dead connection fails over instead of hanging
+RPC_TIMEOUT = 6
+SIGS_TIMEOUT = 6
+TX_TIMEOUT = 8
+JUPITER_TIMEOUT = 3
+JSON_HEADERS = {"Content-Type": "application/json"}
+MAX_PROCESSED_SIGNATURES = 10000
+MAX_TX_RETRIES = 3  # Requeues for a signature whose transaction couldn't be fetched
+TX_RETRY_DELAY = 2  # Seconds per attempt before a requeued signature is retried
+TOKEN_CACHE_DB = os.environ.get("TOKEN_CACHE_DB", "token_cache.db")
+TOKEN_CACHE_TTL = 86400  # Seconds before a cached token's metadata is refetched
+NEGATIVE_CACHE_TTL = 300  # Seconds before a failed lookup is retried
+TOKEN_CACHE_MAX_ROWS = 50000  # Oldest rows beyond this are pruned at startup
+TOKEN_MEMORY_CACHE_SIZE = 5000  # Tokens kept in the in-memory LRU tier
+UNKNOWN_TOKEN = {"symbol": "???", "name": "Unknown", "decimals": 9}
 MIN_BURN_PERCENT = float(os.environ.get("MIN_BURN_PERCENT", "90"))
 
 # Raydium addresses
 RAYDIUM_AMM_PROGRAM = "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8"
 RAYDIUM_AUTHORITY = "5Q544fKrFoe6tsEbD7S8EmxGTJYAKtTVhAW5Q5pge4j1"
 
+WATCHED = frozenset({RAYDIUM_AMM_PROGRAM, RAYDIUM_AUTHORITY})
+
 # Known burn addresses
-BURN_ADDRESSES = [
-    "1111111111111111111111111111111111111111111",
+# (jsonParsed responses already carry base58 strings, so these are compared as-is)
+BURN_ADDRESSES = frozenset([
     "11111111111111111111111111111111",
+    "1nc1nerator11111111111111111111111111111111",  # Solana incinerator
     "So11111111111111111111111111111111111111112",
-    "burnSoL11111111111111111111111111111111111",
-    "DeadSo11111111111111111111111111111111111",
-]
+])
+
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+def is_valid_pubkey(address: str) -> bool:
+    """Check that a base58 string decodes to a 32-byte public key"""
+    if not 32 <= len(address) <= 44:
+        return False
+    
+    num = 0
+    for ch in address:
+        digit = BASE58_ALPHABET.find(ch)
+        if digit < 0:
+            return False
+        num = num * 58 + digit
+    
+    # Leading '1's encode leading zero bytes
+    zeros = len(address) - len(address.lstrip("1"))
+    return zeros + (num.bit_length() + 7) // 8 == 32
+
+NOTIFY_DEBOUNCE = 1.0  # Seconds to collect a burst of burns into one message
+TELEGRAM_MAX_LENGTH = 4096
+NOTIFY_TIMEOUT = 30  # Seconds before a stuck Telegram send is abandoned
+NOTIFY_MAX_BATCH = 20  # Burns drained into one notification round
+TOKEN_LOOKUP_TIMEOUT = 10  # Seconds a notification waits on token metadata
+
+# Telegram message for a detected burn (filled with str.format_map)
+NOTIF_TMPL = """
+🔥 <b>LP BURN DETECTED!</b> 🔥
+
+📊 <b>Token:</b> {name} ({symbol})
+📍 <b>Address:</b> <code>{short_addr}</code>
+💯 <b>LP Burned:</b> ~{burn_percent}%
+⏰ <b>Time:</b> {timestamp}
+
+🔗 <a href="https://solscan.io/tx/{signature}">View Transaction</a>
+📈 <a href="https://dexscreener.com/solana/{addr}">DexScreener</a>
+🐦 <a href="https://birdeye.so/token/{addr}?chain=solana">Birdeye</a>
+
+⚠️ <i>Always DYOR! LP burn doesn't guarantee safety.</i>
+"""
 
 # ============= LOGGING =============
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('bot.log', mode='a')
-    ]
-)
+# Records are queued and written by a listener thread so console/file I/O
+# never blocks the event loop
+log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+log_handlers = [
+    logging.StreamHandler(),
+    logging.FileHandler('bot.log', mode='a')
+]
+for handler in log_handlers:
+    handler.setFormatter(log_formatter)
+
+log_queue = queue.Queue(-1)
+# Started by run_bot(), so importing this module doesn't spawn a thread
+log_listener = logging.handlers.QueueListener(log_queue, *log_handlers)
+
+# Only merge args here - the listener's handlers apply the real format
+queue_handler = logging.handlers.QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
 logger = logging.getLogger(__name__)
 
+# ============= WEB SERVER FOR RENDER =============
+# Static pages are encoded once at import, not on every health poll
+_HOME_BYTES = """
+        <h1>Solana LP Burn Monitor Bot ✅</h1>
+        <p>Status: Running</p>
+        <p>Monitor: Raydium LP Burns</p>
+        <p>Notifications: Telegram</p>
+        """.encode()
+_HEALTH_BYTES = b"OK"
+
+async def home(request):
+    return web.Response(body=_HOME_BYTES, content_type="text/html", charset="utf-8")
+
+async def health(request):
+    return web.Response(body=_HEALTH_BYTES, content_type="text/plain")
+
+async def start_web_server() -> web.AppRunner:
+    """Serve health checks from the bot's own event loop"""
+    app = web.Application()
+    app.router.add_get('/', home)
+    app.router.add_get('/health', health)
+    
+    runner = web.AppRunner(app)
+    await runner.setup()
+    port = int(os.environ.get('PORT', 10000))
+    site = web.TCPSite(runner, '0.0.0.0', port)
+    await site.start()
+    return runner
+
+# ============= RPC RESILIENCE =============
+class BreakerOpenError(Exception):
+    """Raised when no RPC endpoint is usable - breakers open or all cooling down"""
+    
+    def __init__(self, message: str, wait: Optional[float] = None):
+        super().__init__(message)
+        self.wait = wait  # Seconds until an endpoint should be usable, if known
+
+class AsyncRateLimiter:
+    """Token bucket allowing `rate` acquisitions per second (bursts up to `rate`, 0 disables)"""
+    
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(rate, 1)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+    
+    async def __aenter__(self):
+        if self.rate <= 0:
+            return
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+    
+    async def __aexit__(self, *exc):
+        pass
+
 # ============= MAIN BOT CLASS =============
 class SolanaLPBurnMonitor:
     def __init__(self):
@@ -148,102 +256,504 @@ class SolanaLPBurnMonitor:
             print("="*50 + "\n")
             sys.exit(1)
         
+        # Validate watched addresses once here instead of on every RPC call
+        for address in WATCHED | BURN_ADDRESSES:
+            if not is_valid_pubkey(address):
+                logger.error(f"Invalid address in config: {address}")
+                sys.exit(1)
+        
         self.telegram_bot = Bot(token=TELEGRAM_BOT_TOKEN)
-        self.rpc_index = 0
-        self.rpc_urls = RPC_URLS
-        self.solana_client = AsyncClient(self.rpc_urls[0])
-        self.processed_signatures = set()
-        self.token_cache = {}
+        self.endpoints = deque(RPC_URLS)  # Round-robin RPC pool
+        self.health = {
+            url: {
+                "fail_until": 0, "fails": 0, "state": "CLOSED", "opened_at": 0,
+                "strikes": 0, "disabled": False, "probing": False
+            }
+            for url in RPC_URLS
+        }
+        self.processed_signatures = OrderedDict()  # Insertion-ordered LRU of seen signatures
+        self.retry_counts = {}  # signature -> requeues after a failed fetch
+        self.sig_queue = asyncio.Queue(maxsize=1000)  # ingester -> checkers
+        self.notify_queue = asyncio.Queue(maxsize=256)  # checkers -> notifier (bulkhead)
+        self.last_sig = None  # Newest signature seen - backfill cursor
+        self.backfill_task = None  # Latest gap backfill, runs beside the live stream
+        self.token_cache = OrderedDict()  # LRU of mint -> token info, bounded and expiring
+        self.cache_db = None  # On-disk tier behind token_cache
+        # sqlite connections aren't safe to share across threads - one thread owns it
+        self.db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="token-cache")
         self.session = None
-        self.rate_limit_delay = 2  # seconds between requests
+        self.rpc_sem = None
+        self.request_log = {}  # host -> timestamps of requests in the last minute
+        self.rpc_limiter = None
         
     async def setup(self):
         """Initialize aiohttp session"""
-        self.session = aiohttp.ClientSession()
+        # One pooled keep-alive session serves RPC, WebSocket and Jupiter traffic
+        conn = aiohttp.TCPConnector(
+            limit=128, limit_per_host=64, ttl_dns_cache=300, keepalive_timeout=60
+        )
+        self.session = aiohttp.ClientSession(
+            connector=conn,
+            timeout=aiohttp.ClientTimeout(total=15)
+        )
+        # Caps in-flight HTTP calls so bursts don't trip provider rate limits
+        self.rpc_sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # Token bucket pacing RPC POSTs instead of a fixed sleep before each one
+        self.rpc_limiter = AsyncRateLimiter(RPC_RATE_LIMIT)
+        
+        try:
+            self.cache_db = await self._db_call(self._open_cache_db)
+        except sqlite3.Error as e:
+            logger.warning(f"Token cache disabled ({TOKEN_CACHE_DB}): {e}")
         
     async def cleanup(self):
         """Cleanup resources"""
+        if self.backfill_task:
+            self.backfill_task.cancel()
         if self.session:
             await self.session.close()
-        await self.solana_client.close()
+        if self.cache_db:
+            await self._db_call(self.cache_db.close)
+        self.db_executor.shutdown(wait=False)
+    
+    def _seen(self, sig: str) -> bool:
+        """Return True if sig was already processed, otherwise remember it"""
+        if sig in self.processed_signatures:
+            self.processed_signatures.move_to_end(sig)
+            return True
+        
+        self.processed_signatures[sig] = None
+        if len(self.processed_signatures) > MAX_PROCESSED_SIGNATURES:
+            self.processed_signatures.popitem(last=False)
+        return False
+    
+    def _requeue(self, sigs: List[str], count: bool = True, delay: Optional[float] = None):
+        """Schedule signatures whose fetch failed for another go, a bounded number of times"""
+        loop = asyncio.get_running_loop()
+        for sig in sigs:
+            # Waiting out an unavailable pool isn't a failed fetch - don't spend a retry
+            tries = self.retry_counts.get(sig, 0) + (1 if count else 0)
+            if tries > MAX_TX_RETRIES:
+                self.retry_counts.pop(sig, None)
+                logger.warning(f"Giving up on {sig[:20]}... after {MAX_TX_RETRIES} retries")
+                continue
+            if tries:
+                self.retry_counts[sig] = tries
+            
+            # Give a lagging node time to catch up instead of retrying at once;
+            # the signature stays seen meanwhile so duplicates are still skipped
+            wait = delay if delay is not None else TX_RETRY_DELAY * max(tries, 1)
+            loop.call_later(wait, self._requeue_put, sig)
+    
+    def _requeue_put(self, sig: str):
+        """Return a delayed retry to the signature queue"""
+        self.processed_signatures.pop(sig, None)  # Let _seen admit it again
+        try:
+            self.sig_queue.put_nowait(sig)
+        except asyncio.QueueFull:
+            # Never block the event loop callback on a full queue
+            self.retry_counts.pop(sig, None)
+            logger.warning(f"Signature queue full, dropping retry of {sig[:20]}...")
+    
+    async def _db_call(self, func, *args):
+        """Run a token cache operation on the cache's dedicated thread"""
+        return await asyncio.get_running_loop().run_in_executor(self.db_executor, func, *args)
+    
+    def _open_cache_db(self) -> sqlite3.Connection:
+        """Open the persistent token cache, creating the table if needed"""
+        db = sqlite3.connect(TOKEN_CACHE_DB)
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS tokens ("
+            "mint TEXT PRIMARY KEY, symbol TEXT, name TEXT, decimals INT, ts INT, "
+            "neg_until INT DEFAULT 0)"
+        )
+        try:
+            # Caches created before negative caching lack this column
+            db.execute("ALTER TABLE tokens ADD COLUMN neg_until INT DEFAULT 0")
+        except sqlite3.OperationalError:
+            pass
+        
+        # Drop expired rows and keep the file bounded across restarts
+        now = int(time.time())
+        db.execute(
+            "DELETE FROM tokens WHERE ts < ? OR (neg_until > 0 AND neg_until < ?)",
+            (now - TOKEN_CACHE_TTL, now)
+        )
+        db.execute(
+            "DELETE FROM tokens WHERE mint NOT IN "
+            "(SELECT mint FROM tokens ORDER BY ts DESC LIMIT ?)",
+            (TOKEN_CACHE_MAX_ROWS,)
+        )
+        db.commit()
+        return db
+    
+    def _cache_get(self, mint_address: str) -> Optional[Dict]:
+        """Read a token from the disk cache, ignoring expired rows"""
+        row = self.cache_db.execute(
+            "SELECT symbol, name, decimals, ts, neg_until FROM tokens WHERE mint = ?",
+            (mint_address,)
+        ).fetchone()
+        if not row:
+            return None
+        
+        now = time.time()
+        if row[4]:
+            # Negative entry - only valid until its short TTL runs out
+            return dict(UNKNOWN_TOKEN, _neg_until=row[4]) if row[4] > now else None
+        if now - row[3] > TOKEN_CACHE_TTL:
+            return None
+        return {"symbol": row[0], "name": row[1], "decimals": row[2], "_ts": row[3]}
+    
+    def _cache_put(self, mint_address: str, info: Dict):
+        """Write a token through to the disk cache"""
+        with self.cache_db:
+            self.cache_db.execute(
+                "INSERT OR REPLACE INTO tokens VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    mint_address, info["symbol"], info["name"], info["decimals"],
+                    int(time.time()), int(info.get("_neg_until", 0))
+                )
+            )
+    
+    def _cache_remember(self, mint_address: str, info: Dict):
+        """Store a token in the in-memory LRU, evicting the least recently used"""
+        self.token_cache[mint_address] = info
+        self.token_cache.move_to_end(mint_address)
+        if len(self.token_cache) > TOKEN_MEMORY_CACHE_SIZE:
+            self.token_cache.popitem(last=False)
     
     async def get_token_info(self, mint_address: str) -> Dict:
-        """Get token metadata from Jupiter API"""
-        if mint_address in self.token_cache:
-            return self.token_cache[mint_address]
+        """Get token metadata - memory cache, then disk cache, then Jupiter API"""
+        cached = self.token_cache.get(mint_address)
+        if cached:
+            now = time.time()
+            if "_neg_until" in cached:
+                fresh = cached["_neg_until"] > now
+            else:
+                fresh = now - cached["_ts"] <= TOKEN_CACHE_TTL
+            if fresh:
+                self.token_cache.move_to_end(mint_address)
+                return cached
+            del self.token_cache[mint_address]
+        
+        if self.cache_db:
+            try:
+                info = await self._db_call(self._cache_get, mint_address)
+                if info:
+                    self._cache_remember(mint_address, info)
+                    return info
+            except sqlite3.Error as e:
+                logger.debug(f"Token cache read failed: {e}")
         
         try:
             # Try Jupiter API first
             url = f"https://price.jup.ag/v4/token/{mint_address}"
-            async with self.session.get(url, timeout=5) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    info = {
-                        "symbol": data.get("symbol", "???"),
-                        "name": data.get("name", "Unknown"),
-                        "decimals": data.get("decimals", 9)
-                    }
-                    self.token_cache[mint_address] = info
-                    return info
-        except:
-            pass
+            data = await self._request_json(
+                "GET", url, timeout=aiohttp.ClientTimeout(total=JUPITER_TIMEOUT)
+            )
+            info = {
+                "symbol": data.get("symbol", "???"),
+                "name": data.get("name", "Unknown"),
+                "decimals": data.get("decimals", 9),
+                "_ts": time.time()
+            }
+        except Exception:
+            # Remember the failure briefly so dead mints aren't re-queried every burn
+            info = dict(UNKNOWN_TOKEN, _neg_until=time.time() + NEGATIVE_CACHE_TTL)
         
-        return {"symbol": "???", "name": "Unknown", "decimals": 9}
+        self._cache_remember(mint_address, info)
+        if self.cache_db:
+            try:
+                await self._db_call(self._cache_put, mint_address, info)
+            except sqlite3.Error as e:
+                logger.debug(f"Token cache write failed: {e}")
+        return info
     
-    async def rotate_rpc(self):
-        """Rotate to next RPC endpoint"""
+    def _track_request(self, url: str) -> int:
+        """Record a request against its host and return the rolling 60s count"""
+        host = urlsplit(url).netloc
+        now = time.monotonic()
+        log = self.request_log.setdefault(host, deque())
+        log.append(now)
+        while log and now - log[0] > 60:
+            log.popleft()
+        return len(log)
+    
+    def _parse_retry_after(self, retry_after: Optional[str]) -> Optional[float]:
+        """Seconds from a Retry-After header (delta-seconds or HTTP date)"""
+        if not retry_after:
+            return None
         try:
-            await self.solana_client.close()
-        except:
+            return max(float(retry_after), 0)
+        except ValueError:
             pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+            return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0)
+        except (TypeError, ValueError):
+            return None
+    
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before retrying - honors Retry-After, else exponential backoff"""
+        server_delay = self._parse_retry_after(retry_after)
+        if server_delay is not None:
+            # Don't let a bogus header (e.g. a day) park the caller
+            return min(server_delay, MAX_RETRY_AFTER)
         
-        self.rpc_index = (self.rpc_index + 1) % len(self.rpc_urls)
-        self.solana_client = AsyncClient(self.rpc_urls[self.rpc_index])
-        logger.info(f"🔄 Switched to RPC #{self.rpc_index}: {self.rpc_urls[self.rpc_index]}")
+        # Full jitter: anywhere up to the capped exponential delay
+        return random.uniform(0, min(2 ** attempt, 30))
     
-    async def check_transaction(self, signature: str) -> Optional[Dict]:
-        """Check if transaction is an LP burn"""
-        try:
-            # Add delay to avoid rate limits
-            await asyncio.sleep(self.rate_limit_delay)
-            
-            # Convert string to Signature object
-            sig_obj = Signature.from_string(signature)
+    async def _request_json(self, method: str, url: str, retries: int = MAX_RETRIES, **kwargs):
+        """HTTP request returning parsed JSON, retrying 429s as the server asks"""
+        attempt = 0
+        
+        while True:
+            rate = self._track_request(url)
+            async with self.rpc_sem:
+                async with self.session.request(method, url, **kwargs) as resp:
+                    if resp.status != 429 or attempt >= retries:
+                        resp.raise_for_status()
+                        return orjson.loads(await resp.read())
+                    retry_after = resp.headers.get("Retry-After")
             
-            tx = await self.solana_client.get_transaction(
-                sig_obj,
-                commitment=Confirmed,
-                max_supported_transaction_version=0
+            # Sleep outside the semaphore so other requests can proceed
+            delay = self._retry_delay(attempt, retry_after)
+            logger.warning(
+                f"⚠️ Rate limited by {urlsplit(url).netloc} "
+                f"({rate} req/min), retrying in {delay:.1f}s..."
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+    
+    def _breaker_allows(self, url: str, now: float) -> bool:
+        """CLOSED passes; OPEN blocks until its cooldown; HALF_OPEN admits one probe"""
+        state = self.health[url]
+        if state["state"] == "OPEN":
+            return now - state["opened_at"] >= BREAKER_COOLDOWN
+        if state["state"] == "HALF_OPEN":
+            return not state["probing"]
+        return True
+    
+    def _claim_endpoint(self, url: str) -> str:
+        """Take the chosen endpoint, making it the single probe if its breaker isn't closed"""
+        state = self.health[url]
+        if state["state"] == "OPEN":
+            state["state"] = "HALF_OPEN"
+            logger.info(f"RPC {urlsplit(url).netloc} half-open, probing...")
+        if state["state"] == "HALF_OPEN":
+            state["probing"] = True
+        return url
+    
+    def _pick_endpoint(self) -> str:
+        """Round-robin to the next RPC endpoint that isn't cooling down"""
+        now = time.monotonic()
+        candidates = []
+        for _ in range(len(self.endpoints)):
+            self.endpoints.rotate(-1)
+            url = self.endpoints[0]
+            if self.health[url]["disabled"] or not self._breaker_allows(url, now):
+                continue
+            if self.health[url]["fail_until"] <= now:
+                return self._claim_endpoint(url)
+            candidates.append(url)
+        
+        if not candidates:
+            reopen = [
+                state["opened_at"] + BREAKER_COOLDOWN - now
+                for state in self.health.values()
+                if state["state"] == "OPEN" and not state["disabled"]
+            ]
+            raise BreakerOpenError(
+                "All RPC endpoints are disabled or have open circuit breakers",
+                min(reopen) if reopen else None
             )
+        
+        # Every usable endpoint is cooling down - let the caller back off rather
+        # than hit one before its bench (or Retry-After) has run out
+        wait = min(self.health[u]["fail_until"] for u in candidates) - now
+        raise BreakerOpenError(f"All RPC endpoints are cooling down, next free in {wait:.1f}s", wait)
+    
+    def _mark_failed(self, url: str, retry_after: Optional[str] = None, status: Optional[int] = None):
+        """Bench an endpoint for a backoff window after a 429/5xx/connection error"""
+        state = self.health[url]
+        host = urlsplit(url).netloc
+        now = time.monotonic()
+        state["probing"] = False
+        
+        if status in (401, 403):
+            # Credentials won't start working mid-run - drop it for this session
+            state["disabled"] = True
+            logger.warning(f"🚫 RPC {host} disabled (HTTP {status})")
+            return
+        
+        if status == 429:
+            # Throttled endpoints cool down on an escalating schedule
+            cooldown = self._parse_retry_after(retry_after)
+            if cooldown is None:
+                cooldown = RATE_LIMIT_COOLDOWNS[min(state["strikes"], len(RATE_LIMIT_COOLDOWNS) - 1)]
+            cooldown = min(cooldown, RATE_LIMIT_COOLDOWNS[-1])
+            state["strikes"] += 1
+            state["fail_until"] = now + cooldown
+            logger.warning(f"🔄 RPC {host} rate limited, cooling down for {cooldown:.0f}s")
+            return
+        
+        delay = self._retry_delay(state["fails"], retry_after)
+        state["fails"] += 1
+        state["fail_until"] = now + delay
+        
+        # A failed probe or too many failures in a row trips the breaker
+        if state["state"] == "HALF_OPEN" or state["fails"] >= BREAKER_THRESHOLD:
+            if state["state"] != "OPEN":
+                logger.warning(f"⛔ RPC {host} breaker open for {BREAKER_COOLDOWN}s")
+            state["state"] = "OPEN"
+            state["opened_at"] = now
+        else:
+            logger.warning(f"🔄 RPC {host} benched for {delay:.1f}s")
+    
+    def _mark_healthy(self, url: str):
+        """Reset an endpoint's failure streak and close its breaker"""
+        state = self.health[url]
+        if state["state"] != "CLOSED":
+            logger.info(f"✅ RPC {urlsplit(url).netloc} recovered")
+        state["fails"] = 0
+        state["strikes"] = 0
+        state["state"] = "CLOSED"
+        state["probing"] = False
+    
+    async def _rpc_post(self, payload, timeout: float = RPC_TIMEOUT):
+        """POST a JSON-RPC payload, failing over across the endpoint pool"""
+        # End-to-end deadline per attempt; a timeout counts against the endpoint
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+        # Serialize once with orjson and send the bytes as-is on every attempt
+        body = orjson.dumps(payload)
+        attempt = 0
+        
+        while True:
+            url = self._pick_endpoint()
             
-            if not tx or not tx.value:
-                return None
+            try:
+                # No same-endpoint retries - another endpoint is tried instead
+                async with self.rpc_limiter:
+                    data = await self._request_json(
+                        "POST", url, retries=0, data=body,
+                        headers=JSON_HEADERS, timeout=client_timeout
+                    )
+            except aiohttp.ClientResponseError as e:
+                if e.status not in (401, 403, 429) and e.status < 500:
+                    raise
+                self._mark_failed(
+                    url, e.headers.get("Retry-After") if e.headers else None, e.status
+                )
+                if e.status in (401, 403):
+                    # That endpoint is now disabled - fail over without spending a
+                    # retry; _pick_endpoint raises once none are left
+                    continue
+                if attempt >= MAX_RETRIES:
+                    raise
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                self._mark_failed(url)
+                if attempt >= MAX_RETRIES:
+                    raise
+            else:
+                self._mark_healthy(url)
+                return data
+            finally:
+                # A probe that ended any other way (4xx, cancellation) frees the slot
+                self.health[url]["probing"] = False
             
-            # Look for burn addresses in transaction
-            tx_data = tx.value
-            if not tx_data.transaction:
+            attempt += 1
+    
+    async def rpc_call(self, method: str, params: Optional[list] = None, timeout: float = RPC_TIMEOUT):
+        """Single Solana JSON-RPC call over the shared aiohttp session"""
+        payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params or []}
+        data = await self._rpc_post(payload, timeout)
+        
+        if "error" in data:
+            raise Exception(f"RPC error in {method}: {data['error']}")
+        return data.get("result")
+    
+    async def fetch_transactions_batch(self, sigs: List[str]) -> Dict[str, Optional[Dict]]:
+        """Fetch several transactions with a single JSON-RPC batch request"""
+        if not sigs:
+            return {}
+        
+        batch = [
+            {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "getTransaction",
+                "params": [
+                    sig,
+                    {
+                        "commitment": "confirmed",
+                        "maxSupportedTransactionVersion": 0,
+                        "encoding": "jsonParsed"
+                    }
+                ]
+            }
+            for i, sig in enumerate(sigs)
+        ]
+        
+        data = await self._rpc_post(batch, TX_TIMEOUT)
+        
+        # Some endpoints (often free tiers) answer a batch with a single error object -
+        # fall back to individual requests issued concurrently
+        if not isinstance(data, list):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Batch request rejected: {data.get('error', data)}, fetching individually")
+            data = await asyncio.gather(
+                *(self._rpc_post(request, TX_TIMEOUT) for request in batch),
+                return_exceptions=True
+            )
+        
+        # Responses may arrive in any order - match them back by id
+        results = {sig: None for sig in sigs}
+        for item in data:
+            if isinstance(item, BaseException):
+                # One failed single call leaves only its own signature unresolved
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Single tx fetch failed: {type(item).__name__}: {item}")
+                continue
+            idx = item.get("id")
+            if not isinstance(idx, int) or not 0 <= idx < len(sigs):
+                continue
+            if "error" in item:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"RPC error for tx {sigs[idx][:20]}...: {item['error']}")
+                continue
+            results[sigs[idx]] = item.get("result")
+        
+        return results
+    
+    def check_transaction(self, signature: str, tx: Optional[Dict]) -> Optional[Dict]:
+        """Check if transaction is an LP burn"""
+        try:
+            if not tx or not tx.get("transaction"):
                 return None
-                
+            
             # Simple check for burn addresses
-            message = tx_data.transaction.message
-            accounts = []
+            message = tx["transaction"].get("message", {})
             
-            # Get all account keys
-            if hasattr(message, 'account_keys'):
-                accounts = [str(key) for key in message.account_keys]
-            elif hasattr(message, 'static_account_keys'):
-                accounts = [str(key) for key in message.static_account_keys]
+            # Get all account keys (jsonParsed includes lookup table accounts)
+            accounts = message.get("accountKeys", [])
             
-            # Check if any burn address is involved
-            has_burn = any(burn in accounts for burn in BURN_ADDRESSES)
-            has_raydium = RAYDIUM_AMM_PROGRAM in accounts or RAYDIUM_AUTHORITY in accounts
+            # Single pass with O(1) lookups, stopping once both are found
+            has_burn = has_raydium = False
+            for key in accounts:
+                pubkey = key["pubkey"]
+                if pubkey in BURN_ADDRESSES:
+                    has_burn = True
+                elif pubkey in WATCHED:
+                    has_raydium = True
+                if has_burn and has_raydium:
+                    break
             
             if has_burn and has_raydium:
                 # Found potential burn transaction
                 logger.info(f"🔥 Potential burn found: {signature[:20]}...")
                 
                 # Extract token address (simplified - would need proper parsing)
-                token_address = accounts[0] if accounts else "unknown"
+                token_address = accounts[0]["pubkey"] if accounts else "unknown"
                 
                 return {
                     "signature": signature,
@@ -253,73 +763,223 @@ class SolanaLPBurnMonitor:
                 }
                 
         except Exception as e:
-            logger.debug(f"Error checking tx {signature[:20]}...: {type(e).__name__}: {str(e)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Error checking tx {signature[:20]}...: {type(e).__name__}: {str(e)}")
             
         return None
     
-    async def send_notification(self, burn_data: Dict):
-        """Send Telegram notification"""
+    def format_notification(self, burn_data: Dict, token: Dict) -> str:
+        """Render the Telegram message for one burn"""
+        addr = burn_data['token_address']
+        return NOTIF_TMPL.format_map({
+            "name": token['name'],
+            "symbol": token['symbol'],
+            "addr": addr,
+            "short_addr": f"{addr[:8]}...{addr[-8:]}",
+            "burn_percent": burn_data['burn_percent'],
+            "timestamp": burn_data['timestamp'],
+            "signature": burn_data['signature']
+        })
+    
+    async def send_notifications(self, burns: List[Dict]):
+        """Send Telegram notifications, packing a burst into as few messages as fit"""
         try:
-            token = await self.get_token_info(burn_data['token_address'])
+            # Throttled Jupiter retries can sleep for a long time - past the
+            # deadline a burn goes out with placeholder metadata instead
+            tokens = await asyncio.gather(
+                *(
+                    asyncio.wait_for(self.get_token_info(burn['token_address']), TOKEN_LOOKUP_TIMEOUT)
+                    for burn in burns
+                ),
+                return_exceptions=True
+            )
+            tokens = [token if isinstance(token, dict) else UNKNOWN_TOKEN for token in tokens]
             
-            message = f"""
-🔥 <b>LP BURN DETECTED!</b> 🔥
-
-📊 <b>Token:</b> {token['name']} ({token['symbol']})
-📍 <b>Address:</b> <code>{burn_data['token_address'][:8]}...{burn_data['token_address'][-8:]}</code>
-💯 <b>LP Burned:</b> ~{burn_data['burn_percent']}%
-⏰ <b>Time:</b> {burn_data['timestamp']}
-
-🔗 <a href="https://solscan.io/tx/{burn_data['signature']}">View Transaction</a>
-📈 <a href="https://dexscreener.com/solana/{burn_data['token_address']}">DexScreener</a>
-🐦 <a href="https://birdeye.so/token/{burn_data['token_address']}?chain=solana">Birdeye</a>
-
-⚠️ <i>Always DYOR! LP burn doesn't guarantee safety.</i>
-"""
+            chunks = [""]
+            for burn_data, token in zip(burns, tokens):
+                message = self.format_notification(burn_data, token)
+                if chunks[-1] and len(chunks[-1]) + len(message) > TELEGRAM_MAX_LENGTH:
+                    chunks.append("")
+                chunks[-1] += message
             
-            await self.telegram_bot.send_message(
-                chat_id=TELEGRAM_CHANNEL_ID,
-                text=message,
-                parse_mode='HTML',
-                disable_web_page_preview=True
-            )
+            for text in chunks:
+                # Bound each send so one stuck message doesn't sink the rest
+                try:
+                    await asyncio.wait_for(
+                        self.telegram_bot.send_message(
+                            chat_id=TELEGRAM_CHANNEL_ID,
+                            text=text,
+                            parse_mode='HTML',
+                            disable_web_page_preview=True
+                        ),
+                        NOTIFY_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    logger.error(f"Telegram send timed out after {NOTIFY_TIMEOUT}s, message dropped")
             
-            logger.info(f"✅ Notification sent for {token['symbol']}")
+            symbols = ", ".join(token['symbol'] for token in tokens)
+            logger.info(f"✅ Notification sent for {symbols}")
             
         except Exception as e:
             logger.error(f"Failed to send notification: {e}")
     
-    async def monitor_loop(self):
-        """Main monitoring loop"""
-        logger.info("🚀 Starting monitor loop...")
+    async def backfill_signatures(self, until: Optional[str], previous: Optional[asyncio.Task] = None):
+        """Queue signatures newer than `until` to cover gaps while the WebSocket was down"""
+        try:
+            if previous:
+                # One backfill at a time; each still covers its own gap
+                await previous
+            
+            if not until:
+                # Cold start: just establish the cursor, don't back-scan history
+                latest = await self.rpc_call(
+                    "getSignaturesForAddress",
+                    [RAYDIUM_AMM_PROGRAM, {"limit": 1, "commitment": "confirmed"}],
+                    SIGS_TIMEOUT
+                )
+                if latest and not self.last_sig:
+                    self.last_sig = latest[0]["signature"]
+                return
+            
+            # Only signatures newer than the last one we saw, paging back with
+            # `before` while pages come back full. The cursor comes from a
+            # confirmed-commitment stream, so query at the same commitment or
+            # a not-yet-finalized `until` won't be found
+            signatures = []
+            options = {"limit": 1000, "until": until, "commitment": "confirmed"}
+            for _ in range(BACKFILL_MAX_PAGES):
+                page = await self.rpc_call(
+                    "getSignaturesForAddress",
+                    [RAYDIUM_AMM_PROGRAM, options],
+                    SIGS_TIMEOUT
+                )
+                signatures.extend(page or [])
+                if not page or len(page) < options["limit"]:
+                    break
+                options["before"] = page[-1]["signature"]
+            else:
+                logger.warning(
+                    f"⚠️ Backfill stopped at {BACKFILL_MAX_PAGES} pages, "
+                    f"signatures older than {signatures[-1]['signature'][:20]}... were skipped"
+                )
+            
+            if not signatures:
+                return
+            if self.last_sig == until:
+                # The live stream hasn't moved the cursor past this range yet
+                self.last_sig = signatures[0]["signature"]  # Newest first
+            
+            logger.info(f"Backfilling {len(signatures)} missed signatures")
+            for sig_info in reversed(signatures):
+                # Failed transactions can't be burns - don't spend a getTransaction on them
+                if sig_info.get("err") is None:
+                    await self.sig_queue.put(sig_info["signature"])
+            
+        except Exception as e:
+            logger.warning(f"Backfill failed: {type(e).__name__}: {str(e)}")
+    
+    async def ws_listener(self):
+        """Subscribe to Raydium program logs and queue every pushed signature"""
+        attempt = 0
+        
+        while True:
+            try:
+                async with self.session.ws_connect(SOLANA_WS_URL, heartbeat=30) as ws:
+                    await ws.send_json({
+                        "jsonrpc": "2.0",
+                        "id": 1,
+                        "method": "logsSubscribe",
+                        "params": [
+                            {"mentions": [RAYDIUM_AMM_PROGRAM]},
+                            {"commitment": "confirmed"}
+                        ]
+                    })
+                    
+                    # The subscribe reply comes before any notification - an error
+                    # here would otherwise leave a live socket that never pushes
+                    reply = await ws.receive_json(loads=orjson.loads, timeout=RPC_TIMEOUT)
+                    if "error" in reply:
+                        raise Exception(f"logsSubscribe rejected: {reply['error']}")
+                    if reply.get("id") != 1 or "result" not in reply:
+                        raise Exception(f"Unexpected logsSubscribe reply: {reply}")
+                    
+                    logger.info(f"📡 Subscribed to Raydium logs: {SOLANA_WS_URL} (id {reply['result']})")
+                    attempt = 0  # Reset backoff once subscribed
+                    
+                    # Backfill beside the live stream so pushes aren't held up
+                    self.backfill_task = asyncio.create_task(
+                        self.backfill_signatures(self.last_sig, self.backfill_task)
+                    )
+                    
+                    async for msg in ws:
+                        if msg.type == aiohttp.WSMsgType.ERROR:
+                            break
+                        if msg.type != aiohttp.WSMsgType.TEXT:
+                            continue
+                        
+                        data = msg.json(loads=orjson.loads)
+                        if data.get("method") != "logsNotification":
+                            continue
+                        
+                        value = data["params"]["result"]["value"]
+                        self.last_sig = value["signature"]
+                        if value.get("err") is None:
+                            await self.sig_queue.put(value["signature"])
+                
+                logger.warning("⚠️ WebSocket closed by server")
+                
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ WebSocket error: {type(e).__name__}: {str(e)}")
+            
+            # Reconnect with exponential backoff
+            attempt += 1
+            delay = min(2 ** attempt, 60)
+            logger.info(f"Reconnecting WebSocket in {delay}s...")
+            await asyncio.sleep(delay)
+    
+    async def check_worker(self, worker_id: int):
+        """Pull queued signatures, batch-check them and queue any burns found"""
         error_count = 0
         
         while True:
             try:
-                # Get recent signatures with smaller limit to reduce load
-                signatures = await self.solana_client.get_signatures_for_address(
-                    Pubkey.from_string(RAYDIUM_AMM_PROGRAM),
-                    limit=5  # Reduced from 10
-                )
+                # Wait for the next push, then drain whatever else is already queued
+                pending = [await self.sig_queue.get()]
+                while len(pending) < BATCH_SIZE and not self.sig_queue.empty():
+                    pending.append(self.sig_queue.get_nowait())
                 
-                if signatures and signatures.value:
-                    logger.info(f"Found {len(signatures.value)} transactions to check")
-                    for sig_info in signatures.value:
-                        sig = str(sig_info.signature)
-                        
-                        if sig not in self.processed_signatures:
-                            self.processed_signatures.add(sig)
-                            logger.debug(f"Checking signature: {sig[:10]}...")
-                            
-                            # Check if it's a burn
-                            burn_data = await self.check_transaction(sig)
-                            if burn_data:
-                                await self.send_notification(burn_data)
+                new_sigs = [sig for sig in pending if not self._seen(sig)]
                 
-                # Clean up old signatures
-                if len(self.processed_signatures) > 10000:
-                    keep = list(self.processed_signatures)[-5000:]
-                    self.processed_signatures = set(keep)
+                if new_sigs:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Checking {len(new_sigs)} signatures in one batch...")
+                    
+                    # One round-trip for every new signature in this batch
+                    try:
+                        transactions = await self.fetch_transactions_batch(new_sigs)
+                    except BreakerOpenError as e:
+                        self._requeue(new_sigs, count=False, delay=e.wait)
+                        raise
+                    except Exception:
+                        self._requeue(new_sigs)
+                        raise
+                    
+                    # Transactions the node couldn't return yet get another go
+                    self._requeue([sig for sig, tx in transactions.items() if tx is None])
+                    for sig, tx in transactions.items():
+                        if tx is None:
+                            continue
+                        self.retry_counts.pop(sig, None)
+                        # Check if it's a burn
+                        burn_data = self.check_transaction(sig, tx)
+                        if burn_data:
+                            # Never let a stalled Telegram hold up detection
+                            try:
+                                self.notify_queue.put_nowait(burn_data)
+                            except asyncio.QueueFull:
+                                logger.warning(f"Notify bulkhead full, dropping {sig[:20]}...")
                 
                 error_count = 0  # Reset error count on success
                 
@@ -328,31 +988,39 @@ class SolanaLPBurnMonitor:
                 error_msg = str(e)
                 error_type = type(e).__name__
                 
-                logger.error(f"Monitor error (#{error_count}): {error_type}: {error_msg}")
+                logger.error(f"Checker #{worker_id} error (#{error_count}): {error_type}: {error_msg}")
                 
-                if "429" in error_msg or "Too Many Requests" in error_msg:
-                    logger.warning(f"⚠️ Rate limited, rotating RPC and waiting...")
-                    await self.rotate_rpc()
-                    await asyncio.sleep(30)
+                # Endpoint failover already happened inside _rpc_post
+                if isinstance(e, BreakerOpenError):
+                    logger.warning(f"⚠️ No RPC endpoint available right now, waiting...")
+                elif "429" in error_msg or "Too Many Requests" in error_msg:
+                    logger.warning(f"⚠️ Rate limited across the RPC pool, waiting...")
                 elif "403" in error_msg or "Forbidden" in error_msg:
-                    logger.warning(f"⚠️ Access forbidden, rotating RPC...")
-                    await self.rotate_rpc()
-                    await asyncio.sleep(5)
+                    logger.warning(f"⚠️ Access forbidden across the RPC pool, waiting...")
                 elif "503" in error_msg or "Service Unavailable" in error_msg:
-                    logger.warning(f"⚠️ RPC unavailable, rotating...")
-                    await self.rotate_rpc()
-                    await asyncio.sleep(10)
+                    logger.warning(f"⚠️ RPC pool unavailable, waiting...")
                 elif "Connection" in error_msg or "Timeout" in error_msg:
                     logger.warning(f"⚠️ Connection issue, waiting...")
-                    await asyncio.sleep(10)
                 
-                if error_count > 10:
-                    logger.error("Too many errors, rotating RPC and waiting 60s...")
-                    await self.rotate_rpc()
-                    await asyncio.sleep(60)
-                    error_count = 0
+                if isinstance(e, BreakerOpenError) and e.wait is not None:
+                    # Sleep until the pool says an endpoint is usable again
+                    await asyncio.sleep(e.wait)
+                else:
+                    # Exponential backoff with jitter, capped at 30s
+                    await asyncio.sleep(self._retry_delay(error_count))
+    
+    async def notify_worker(self):
+        """Send queued burn notifications so Telegram latency never stalls checking"""
+        while True:
+            burns = [await self.notify_queue.get()]
             
-            await asyncio.sleep(CHECK_INTERVAL)
+            # Let a burst accumulate briefly, then send it as one message
+            await asyncio.sleep(NOTIFY_DEBOUNCE)
+            # Capped so a huge burst goes out over several rounds, not one
+            while len(burns) < NOTIFY_MAX_BATCH and not self.notify_queue.empty():
+                burns.append(self.notify_queue.get_nowait())
+            
+            await self.send_notifications(burns)
     
     async def start(self):
         """Start the bot"""
@@ -365,17 +1033,11 @@ class SolanaLPBurnMonitor:
             
             # Test Solana connection
             try:
-                slot = await self.solana_client.get_slot()
-                logger.info(f"✅ Solana RPC connected: slot {slot.value}")
-                logger.info(f"📡 Using RPC: {self.rpc_urls[self.rpc_index]}")
+                slot = await self.rpc_call("getSlot")
+                logger.info(f"✅ Solana RPC connected: slot {slot}")
+                logger.info(f"📡 Using RPC pool of {len(self.endpoints)} endpoints")
             except Exception as e:
-                logger.warning(f"Initial RPC failed, rotating...")
-                await self.rotate_rpc()
-                try:
-                    slot = await self.solana_client.get_slot()
-                    logger.info(f"✅ Solana RPC connected after rotation: slot {slot.value}")
-                except:
-                    logger.warning(f"Solana connection warning, continuing anyway...")
+                logger.warning(f"Solana connection warning, continuing anyway...")
             
             # Send startup message
             try:
@@ -383,7 +1045,7 @@ class SolanaLPBurnMonitor:
                     chat_id=TELEGRAM_CHANNEL_ID,
                     text="🤖 <b>LP Burn Monitor Started!</b>\n\n"
                          f"📍 Monitoring: Raydium\n"
-                         f"⏱ Interval: {CHECK_INTERVAL}s\n"
+                         f"⚡ Mode: live (logsSubscribe)\n"
                          f"🔥 Min Burn: {MIN_BURN_PERCENT}%\n\n"
                          f"<i>Ready to detect LP burns...</i>",
                     parse_mode='HTML'
@@ -391,8 +1053,13 @@ class SolanaLPBurnMonitor:
             except Exception as e:
                 logger.warning(f"Could not send startup message: {e}")
             
-            # Start monitoring
-            await self.monitor_loop()
+            # Start monitoring: ingester -> checkers -> notifier
+            logger.info(f"🚀 Starting monitor with {CHECK_WORKERS} checkers...")
+            await asyncio.gather(
+                self.ws_listener(),
+                *(self.check_worker(i) for i in range(CHECK_WORKERS)),
+                self.notify_worker()
+            )
             
         except KeyboardInterrupt:
             logger.info("Shutting down...")
@@ -404,27 +1071,34 @@ class SolanaLPBurnMonitor:
 # ============= MAIN ENTRY POINT =============
 async def main():
     """Main async function"""
-    monitor = SolanaLPBurnMonitor()
-    await monitor.start()
+    # Start web server for Render
+    runner = await start_web_server()
+    logger.info("Web server started for health checks")
+    
+    try:
+        monitor = SolanaLPBurnMonitor()
+        await monitor.start()
+    finally:
+        await runner.cleanup()
 
 def run_bot():
     """Run the bot"""
+    log_listener.start()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
     except Exception as e:
         logger.error(f"Bot crashed: {e}")
+    finally:
+        # Flushes any queued records before the process exits
+        log_listener.stop()
 
 if __name__ == "__main__":
     print("=" * 50)
     print("SOLANA LP BURN MONITOR BOT")
     print("=" * 50)
     
-    # Start web server for Render
-    start_web_server()
-    logger.info("Web server started for health checks")
-    
     # Configuration check
     if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHANNEL_ID:
         print("\n⚠️  CONFIGURATION REQUIRED!")
@@ -433,8 +1107,12 @@ if __name__ == "__main__":
         print("  TELEGRAM_CHANNEL_ID = Your channel ID (e.g. @channelname or -1234567)")
         print("\nOptional variables:")
         print("  SOLANA_RPC_URL = RPC endpoint (default: mainnet)")
-        print("  CHECK_INTERVAL = Check interval in seconds (default: 10)")
+        print("  SOLANA_RPC_URLS = Comma-separated RPC pool (overrides SOLANA_RPC_URL)")
+        print("  SOLANA_WS_URL = WebSocket endpoint (default: derived from SOLANA_RPC_URL)")
+        print("  BATCH_SIZE = Max transactions fetched per RPC batch (default: 20)")
+        print("  RPC_RATE_LIMIT = Max RPC requests per second (default: 0 = unlimited)")
         print("  MIN_BURN_PERCENT = Minimum burn % to notify (default: 90)")
+        print("  TOKEN_CACHE_DB = Token metadata cache file (default: token_cache.db)")
         print("\nFor Render.com deployment:")
         print("1. Upload this file as 'app.py' to GitHub")
         print("2. Connect GitHub to Render")
@@ -447,8 +1125,8 @@ if __name__ == "__main__":
     print(f"\n✅ Configuration loaded:")
     print(f"  Bot Token: {'*' * 10}{TELEGRAM_BOT_TOKEN[-10:] if TELEGRAM_BOT_TOKEN else 'NOT SET'}")
     print(f"  Channel: {TELEGRAM_CHANNEL_ID}")
-    print(f"  RPC: {RPC_URLS[0]}")
-    print(f"  Interval: {CHECK_INTERVAL}s")
+    print(f"  RPC: {RPC_URLS[0]} (+{len(RPC_URLS) - 1} in pool)")
+    print(f"  WebSocket: {SOLANA_WS_URL}")
     print(f"  Min Burn: {MIN_BURN_PERCENT}%")
     print("=" * 50)
     print("\n🚀 Starting bot...\n")